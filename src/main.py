@@ -1,8 +1,189 @@
-from json import load
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from math import ceil, pi, sqrt
 from materialProperties.properties import properties
-from jsonschema import validate
-from jsonschema.exceptions import ValidationError
+from jsonschema.validators import validator_for
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+try:
+    from fastjsonschema import JsonSchemaException, compile as compile_schema
+except ImportError:
+    compile_schema = None
+
+AXIAL_SPACINGS = (0.05, 0.08, 0.1, 0.11, 0.12, 0.125, 0.13, 0.14, 0.15, 0.17, 0.18, 0.19, 0.2, 0.22, 0.25, 0.3)
+"""tuple: Typical bar axial spacings [m] for plate reinforcement, in ascending order
+"""
+
+A_COEFFICIENT_LIMITS = (5, 35, 50, 100, 150, 300, 500)
+"""tuple: Upper limits of the dependant value ranges of the a coefficient approximations used for punching verification
+"""
+
+A_COEFFICIENT_POLYNOMIALS = (
+    (0, 0, 0, 0.2),
+    (0, -3.4604e-4, 4.0508e-2, 6.1094e-3),
+    (6.9861e-6, -1.0796e-3, 6.6182e-2, -2.9342e-1),
+    (2.5424e-8, -3.5481e-5, 1.3977e-2, 5.7667e-1),
+    (9.9559e-8, -5.7721e-5, 1.6201e-2, 5.0253e-1),
+    (2.3680e-8, -2.3576e-5, 1.1079e-2, 7.5862e-1),
+    (-1e-71, -2.2634e-6, 4.6857e-3, 1.3980),
+)
+"""tuple: Cubic polynomial coefficients (from the highest power) of the a coefficient approximation for each range
+"""
+
+CONCRETE_STRENGTHS = {name.replace('_', '/'): int(name[1:3]) for name in properties['concrete_class'].__members__}
+"""dict: Characteristic cylinder strength [MPa] for each concrete class (e.g. C25/30)
+"""
+
+EXPOSURE_CLASSES = {name: exposure_class.value for name, exposure_class in properties['exp_class'].__members__.items()}
+"""dict: Properties (recommended concrete class and minimum covers) of each exposure class
+"""
+
+MATERIAL_KEYS = {code: (f'{code}_concr_class_combo', f'{code}_steel_grade_combo') for code in 'bcfp'}
+"""dict: Parameter keys of concrete class and steel grade for each element code
+"""
+
+COVER_KEYS = {code: (f'{code}_exp_combo', f'{code}_concr_cover_lineEdit') for code in 'bcfp'}
+"""dict: Parameter keys of exposure class and nominal concrete cover for each element code
+"""
+
+
+@lru_cache(maxsize=None)
+def _load_schema(element_type):
+    """
+    Return dictionary containing schema of given element type, load from schemas directory.
+
+    Results are cached, so each schema file is read and parsed once, with orjson if it is installed.
+
+    Parameters
+    ----------
+    element_type : str
+        Type of the element (e.g. plate)
+
+    Returns
+    -------
+    dict
+    """
+    schema_path = f'json_schema/{element_type}_schema.json'
+    with open(schema_path, 'rb') as json_schema_file:
+        return loads(json_schema_file.read())
+
+
+@lru_cache(maxsize=None)
+def _get_validator(element_type):
+    """
+    Return validating function for the schema of given element type.
+
+    Results are cached, so the schema is checked and compiled once per element type.
+
+    Parameters
+    ----------
+    element_type : str
+        Type of the element (e.g. plate)
+
+    Returns
+    -------
+    callable
+    """
+    return _create_validator(_load_schema(element_type))
+
+
+def _create_validator(schema):
+    """
+    Return function checking if the data is valid against given schema. The schema is compiled with fastjsonschema
+    if it is installed, otherwise jsonschema validator of the draft declared by the schema is used, after checking
+    the schema itself.
+
+    Parameters
+    ----------
+    schema : dict
+        Dictionary containing JSON schema
+
+    Returns
+    -------
+    callable
+    """
+    if compile_schema is None:
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema).is_valid
+
+    # Defaults are not filled in and formats are not asserted, same as with jsonschema
+    validate = compile_schema(schema, use_default=False, use_formats=False)
+
+    def is_valid(data):
+        try:
+            validate(data)
+        except JsonSchemaException:
+            return False
+        return True
+
+    return is_valid
+
+
+@lru_cache(maxsize=None)
+def _get_material_properties(concrete_class, steel_grade):
+    """
+    Return the properties of given concrete class and steel grade from the materialProperties module.
+
+    Results are cached, as the same pair of materials is usually shared by many elements.
+
+    Parameters
+    ----------
+    concrete_class : str
+        Concrete class (e.g. C25/30)
+    steel_grade : str
+        Steel grade (e.g. RB500W)
+
+    Returns
+    -------
+    dict, dict
+    """
+    concrete_properties = properties['concrete_class'][concrete_class.replace('/', '_')].value
+
+    if steel_grade == '20G2VY':
+        steel_grade = 'A_20G2VY'
+    steel_properties = properties['steel_grade'][steel_grade].value
+
+    return concrete_properties, steel_properties
+
+
+@lru_cache(maxsize=None)
+def _get_design_strengths(concrete_class, steel_grade):
+    """
+    Return the strengths of given concrete class and steel grade converted to kPa, including design values
+    of concrete strengths.
+
+    Results are cached, so the unit conversions are performed once for each pair of materials.
+
+    Parameters
+    ----------
+    concrete_class : str
+        Concrete class (e.g. C25/30)
+    steel_grade : str
+        Steel grade (e.g. RB500W)
+
+    Returns
+    -------
+    dict
+    """
+    concrete_properties, steel_properties = _get_material_properties(concrete_class, steel_grade)
+
+    f_ck = concrete_properties['fck'] * 1000  # [kPa]
+    f_ctk = concrete_properties['fctk_0.05'] * 1000  # [kPa]
+
+    return {
+        'f_ck': f_ck,
+        'f_cd': f_ck / 1.4,
+        'f_ctm': concrete_properties['fctm'] * 1000,
+        'f_ctk': f_ctk,
+        'f_ctd': f_ctk / 1.4,
+        'f_yd': steel_properties['fyd'] * 1000,
+        'f_yk': steel_properties['fyk'] * 1000,
+    }
 
 
 class Element:
@@ -13,10 +194,15 @@ class Element:
     ----------
     None
     """
+    __slots__ = ('data_dict', 'element_type', 'element_code', 'parameters', 'validation_schema', 'valid',
+                 'validation_remarks', 'concrete_properties', 'steel_properties', 'design_strengths')
+
     def __init__(self, task_parameters_dict):
         """
         Initialize information about the task such as type of the element, and its scheme. Validate information with
-        the appropriate schema.
+        the appropriate schema. Get properties and strengths of the materials if the information is valid. Materials
+        or exposure class not found in the materialProperties module make the information not valid, with the reason
+        stored in validation remarks.
 
         Parameters
         ----------
@@ -36,6 +222,74 @@ class Element:
         self.validation_schema = self.load_schema()
         self.valid = self.validate_data(data_dict=self.data_dict, validation_schema=self.validation_schema)
 
+        self.validation_remarks = []
+        self.concrete_properties, self.steel_properties, self.design_strengths = None, None, None
+
+        if self.valid:
+            try:
+                concrete_properties, steel_properties = self.get_material_properties()
+                design_strengths = self.get_design_strengths()
+            except KeyError:
+                concrete_key, steel_key = MATERIAL_KEYS[self.element_code]
+                self.validation_remarks.append(
+                    f"Concrete class {self.parameters[concrete_key]} or steel grade {self.parameters[steel_key]} "
+                    f"not found in material properties.")
+
+            exposure_class = self.parameters[COVER_KEYS[self.element_code][0]]
+            if exposure_class not in EXPOSURE_CLASSES:
+                self.validation_remarks.append(f"Exposure class {exposure_class} not found in material properties.")
+
+            if self.validation_remarks:
+                self.valid = False
+            else:
+                # Cached dictionaries are shared by all elements with the same materials, hence copied
+                self.concrete_properties, self.steel_properties = dict(concrete_properties), dict(steel_properties)
+                self.design_strengths = dict(design_strengths)
+
+    @staticmethod
+    def load_savefile(path):
+        """
+        Return dictionary with parameters of the task, loaded from the .rcalc save file.
+
+        The file is read as bytes and parsed with orjson if it is installed, otherwise with the standard json module.
+
+        Parameters
+        ----------
+        path : str
+            Path to the save file
+
+        Returns
+        -------
+        dict
+        """
+        with open(path, 'rb') as save_file:
+            return loads(save_file.read())
+
+    @staticmethod
+    def batch(paths):
+        """
+        Return the results of calculations for the tasks stored in given save files.
+
+        Convenience wrapper only, a plain loop over load_savefile and the dispatcher. Each file is calculated with
+        the element class stored in it, whichever class the method is called on, so material properties cached for
+        one element are reused by the following ones.
+
+        Parameters
+        ----------
+        paths : iterable of str
+            Paths to the save files
+
+        Returns
+        -------
+        list
+        """
+        results = []
+        for path in paths:
+            task_parameters_dict = Element.load_savefile(path)
+            element_class = dispatcher[task_parameters_dict['element'][:-4]]
+            results.append(element_class(task_parameters_dict).calc_reinforcement())
+        return results
+
     def get_material_properties(self):
         """
         Return the material properties for the task from the materialProperties module
@@ -48,19 +302,28 @@ class Element:
         -------
         dict, dict
         """
-        element_concrete_class = self.parameters[f'{self.element_code}_concr_class_combo'].replace('/', '_')
-        concrete_properties = properties['concrete_class'][element_concrete_class].value
+        concrete_key, steel_key = MATERIAL_KEYS[self.element_code]
+        return _get_material_properties(self.parameters[concrete_key], self.parameters[steel_key])
 
-        element_steel_grade = self.parameters[f'{self.element_code}_steel_grade_combo']
-        if element_steel_grade == '20G2VY':
-            element_steel_grade = 'A_20G2VY'
-        steel_properties = properties['steel_grade'][element_steel_grade].value
+    def get_design_strengths(self):
+        """
+        Return the strengths of the task's materials in kPa from the materialProperties module
 
-        return concrete_properties, steel_properties
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+        """
+        concrete_key, steel_key = MATERIAL_KEYS[self.element_code]
+        return _get_design_strengths(self.parameters[concrete_key], self.parameters[steel_key])
 
     def validate_data(self, data_dict, validation_schema):
         """
-        Validate the data dictionary with the appropriate schema using jsonschema module
+        Validate the data dictionary with the appropriate schema using fastjsonschema or jsonschema module.
+        The validator of the element type's schema is created once and reused, other schemas get a new validator.
 
         Parameters
         ----------
@@ -73,12 +336,47 @@ class Element:
         -------
         bool
         """
-        try:
-            validate(instance=data_dict, schema=validation_schema)
-        except ValidationError:
-            return False
+        if validation_schema is _load_schema(self.element_type):
+            is_valid = _get_validator(self.element_type)
         else:
-            return True
+            is_valid = _create_validator(validation_schema)
+        return is_valid(data_dict)
+
+    def get_rectangular_section_area(self, bend_moment, width, eff_height, f_cd, f_yd, min_area, mu_lim):
+        """
+        Return mu coefficient, alpha_1 coefficient and required reinforcement area of a singly reinforced
+        rectangular section. If mu exceeds its limit value, the section can not be designed and both alpha_1 and
+        required area are None.
+
+        Parameters
+        ----------
+        bend_moment : float
+            Bending moment [kNm]
+        width : float
+            Width of the section [m]
+        eff_height : float
+            Effective height of the section [m]
+        f_cd : float
+            Design compressive strength of concrete [kPa]
+        f_yd : float
+            Design yield strength of steel [kPa]
+        min_area : float
+            Minimum area of the reinforcement [m^2]
+        mu_lim : float
+            Limit value of the mu coefficient
+
+        Returns
+        -------
+        float, float/None, float/None
+        """
+        mu = bend_moment / (width * (eff_height * eff_height) * f_cd)  # [-]
+        if mu > mu_lim:
+            return mu, None, None
+
+        alpha_1 = 0.973 - sqrt((0.974 - 1.95 * mu))  # [-]
+        required_area = max(alpha_1 * width * eff_height * (f_cd / f_yd), min_area)  # [m^2]
+
+        return mu, alpha_1, required_area
 
     def get_plate_reinforcement(self, required_area, min_area, max_area, bar_diam, cover):
         """
@@ -101,18 +399,28 @@ class Element:
         -------
         float/None, float/None
         """
-        # List containing typical bar axial spacing for plate reinforcement
-        axial_spacings = [0.3, 0.25, 0.22, 0.2, 0.19, 0.18, 0.17, 0.15, 0.15,
-                          0.14, 0.13, 0.125, 0.12, 0.11, 0.1, 0.08, 0.05]
-
-        bar_area = pi * (bar_diam / 2) ** 2
-
-        # Find spacing of bars needed to fulfill the required reinforcement conditions
-        for provided_spacing in axial_spacings:
-            if provided_spacing > bar_diam + cover:
-                provided_area = (1 / provided_spacing) * bar_area
-                if provided_area >= required_area and min_area <= provided_area <= max_area:
-                    return provided_area, provided_spacing
+        bar_area = 0.25 * pi * bar_diam * bar_diam
+        target_area = max(required_area, min_area)
+
+        # Provided area grows as the spacing decreases, so the widest spacing providing the required and minimum
+        # area is the only candidate that has to be checked against the bars fitting and maximum area conditions
+        if target_area > 0:
+            spacing_index = bisect_right(AXIAL_SPACINGS, bar_area / target_area) - 1
+            # Correct the spacing if the division was affected by floating point rounding
+            if spacing_index >= 0 and (1 / AXIAL_SPACINGS[spacing_index]) * bar_area < target_area:
+                spacing_index -= 1
+            elif (spacing_index + 1 < len(AXIAL_SPACINGS)
+                  and (1 / AXIAL_SPACINGS[spacing_index + 1]) * bar_area >= target_area):
+                spacing_index += 1
+        else:
+            spacing_index = len(AXIAL_SPACINGS) - 1
+
+        if spacing_index < 0:
+            return None, None
+        provided_spacing = AXIAL_SPACINGS[spacing_index]
+        provided_area = (1 / provided_spacing) * bar_area
+        if provided_spacing > bar_diam + cover and provided_area <= max_area:
+            return provided_area, provided_spacing
         return None, None
 
     def get_beam_reinforcement(self, required_area, min_area, max_area, bar_diam, stirrup_diam, width, cover):
@@ -140,6 +448,41 @@ class Element:
         -------
         float/None, float/None
         """
+        return self.get_beam_reinforcement_layers(required_areas=(required_area,),
+                                                  min_area=min_area,
+                                                  max_area=max_area,
+                                                  bar_diam=bar_diam,
+                                                  stirrup_diam=stirrup_diam,
+                                                  width=width,
+                                                  cover=cover)[0]
+
+    def get_beam_reinforcement_layers(self, required_areas, min_area, max_area, bar_diam, stirrup_diam, width,
+                                      cover):
+        """
+        Return provided reinforcement area and amount of bars for each of the reinforcement layers placed
+        in the same section (e.g. both sides of a column), on the basis of specified requirements.
+
+        Parameters
+        ----------
+        required_areas : iterable of float
+            Required areas of the reinforcement layers
+        min_area : float
+            Minimum area of a reinforcement layer
+        max_area : float
+            Maximum area of a reinforcement layer
+        bar_diam : float
+            Desired diameter of the rebar
+        stirrup_diam : float
+            Desired diameter of the stirrups
+        width : float
+            Width of the element
+        cover : float
+            Concrete cover
+
+        Returns
+        -------
+        list of (float/None, float/None)
+        """
         # Minimum bars required
         min_bars = 2
 
@@ -152,12 +495,26 @@ class Element:
             max_bars = min_bars + add_bars
         else:
             max_bars = min_bars + add_bars - 1
-        # Find amount of bars needed to fulfill the required reinforcement condition
-        for provided_bars in range(min_bars, max_bars + 1):
-            provided_area = provided_bars * pi * (bar_diam / 2) ** 2
-            if provided_area >= required_area and min_area <= provided_area <= max_area:
-                return provided_area, provided_bars
-        return None, None
+
+        bar_area = 0.25 * pi * bar_diam * bar_diam
+
+        reinforcement = []
+        for required_area in required_areas:
+            # Provided area grows with the amount of bars, so the smallest amount fulfilling the required
+            # and minimum area conditions is the only candidate that has to be checked against the limits
+            target_area = max(required_area, min_area)
+            provided_bars = max(min_bars, ceil(target_area / bar_area))
+            # Correct the amount of bars if the division was affected by floating point rounding
+            if provided_bars > min_bars and (provided_bars - 1) * bar_area >= target_area:
+                provided_bars -= 1
+            elif provided_bars * bar_area < target_area:
+                provided_bars += 1
+            provided_area = provided_bars * bar_area
+            if provided_bars <= max_bars and provided_area <= max_area:
+                reinforcement.append((provided_area, provided_bars))
+            else:
+                reinforcement.append((None, None))
+        return reinforcement
 
     def get_nominal_cover(self):
         """
@@ -172,40 +529,42 @@ class Element:
         float/None, list
         """
         remarks = []
-        exposure_class = self.parameters[f'{self.element_code}_exp_combo']
-        concrete_class = self.parameters[f'{self.element_code}_concr_class_combo']
-
-        exposure_class_paroperties = properties['exp_class'][exposure_class].value
-        recommended_concerete_class = exposure_class_paroperties['concrete_class']
-        if int(concrete_class[1:3]) < int(recommended_concerete_class[1:3]):
+        exposure_key, cover_key = COVER_KEYS[self.element_code]
+        exposure_class = self.parameters[exposure_key]
+        concrete_class = self.parameters[MATERIAL_KEYS[self.element_code][0]]
+        concrete_strength = CONCRETE_STRENGTHS[concrete_class]
+
+        exposure_class_properties = EXPOSURE_CLASSES[exposure_class]
+        recommended_concrete_class = exposure_class_properties['concrete_class']
+        if concrete_strength < CONCRETE_STRENGTHS[recommended_concrete_class]:
             remarks.append(
-                f"For exposure class {exposure_class} the minimum recommended concrete class is {recommended_concerete_class.replace('_', '/')}")
+                f"For exposure class {exposure_class} the minimum recommended concrete class is {recommended_concrete_class}")
 
         # Assumed recommended class of the structure according to EC2
         structure_class = 4
         if exposure_class in ['X0', 'XC1', 'XC2', 'XC3', 'XD3', 'XS2', 'XS3']:
-            if int(concrete_class[1:3]) >= 30:
+            if concrete_strength >= 30:
                 structure_class -= 1
         elif exposure_class in ['XC4', 'XD1', 'XD2', 'XS1']:
-            if int(concrete_class[1:3]) >= 40:
+            if concrete_strength >= 40:
                 structure_class -= 1
         if self.element_code == 'p':
             structure_class -= 1
 
         # Minimum cover due to the durability requirement
-        c_min_dur = exposure_class_paroperties[f"S{structure_class}"]
+        c_min_dur = exposure_class_properties[f"S{structure_class}"]
         if c_min_dur is None:
             remarks.append(f"Not able to calculate nominal cover for exposure class {exposure_class}.")
             return None, remarks
         # Minimum cover due to the bond requirement (assuming dg <= 32mm)
-        c_min_b = int(self.parameters[f'{self.element_code}_bar_diam_combo'])
+        c_min_b = int(self.bar_diam)
 
         c_min = 40 if self.element_code == 'f' else max(c_min_dur, c_min_b, 10)
         c_dev = 10
 
         recommended_c_nom = c_min + c_dev
 
-        c_nom = self.parameters[f'{self.element_code}_concr_cover_lineEdit']
+        c_nom = self.parameters[cover_key]
         if c_nom != recommended_c_nom:
             remarks.append(f"Recommended nominal concrete cover value is {recommended_c_nom} mm.")
         else:
@@ -216,6 +575,7 @@ class Element:
     def load_schema(self):
         """
         Return dictionary containing schema, load from schemas directory, for data structure verification.
+        The schema is loaded once per element type and shared by all elements of that type.
 
         Parameters
         ----------
@@ -225,9 +585,7 @@ class Element:
         -------
         dict
         """
-        schema_path = f'json_schema/{self.element_type}_schema.json'
-        with open(schema_path, 'r') as json_schema_file:
-            return load(json_schema_file)
+        return _load_schema(self.element_type)
 
 
 class Plate(Element):
@@ -238,6 +596,8 @@ class Plate(Element):
     ----------
     None
     """
+    __slots__ = ('height', 'nom_cover', 'bar_diam', 'bend_moment')
+
     def __init__(self, path):
         """
         Extend Parent's __init__ method. Initialize detailed information about the task (geometry, loads).
@@ -281,21 +641,22 @@ class Plate(Element):
 
         if not self.valid:
             remarks.append("The file is not valid.")
+            remarks.extend(self.validation_remarks)
 
         else:
             remarks.append("The file is valid, starting calculations...")
 
             # Get material properties
-            concrete_properties, steel_properties = self.get_material_properties()
+            concrete_properties, steel_properties = self.concrete_properties, self.steel_properties
 
             # Concrete
-            f_ck = concrete_properties['fck'] * 1000  # [kPa]
-            f_cd = f_ck / 1.4  # [kPa]
-            f_ctm = concrete_properties['fctm'] * 1000  # [kPa]
+            f_ck = self.design_strengths['f_ck']  # [kPa]
+            f_cd = self.design_strengths['f_cd']  # [kPa]
+            f_ctm = self.design_strengths['f_ctm']  # [kPa]
 
             # Steel
-            f_yd = steel_properties['fyd'] * 1000  # [kPa]
-            f_yk = steel_properties['fyk'] * 1000  # [kPa]
+            f_yd = self.design_strengths['f_yd']  # [kPa]
+            f_yk = self.design_strengths['f_yk']  # [kPa]
             bar_diam = self.bar_diam / 1000  # [m]
 
             # Geometry
@@ -305,7 +666,7 @@ class Plate(Element):
 
             # Check nominal cover
             recommended_nom_cover, nom_cover_remarks = self.get_nominal_cover()
-            remarks.append(*nom_cover_remarks)
+            remarks.extend(nom_cover_remarks)
 
             # Load
             bend_moment = self.bend_moment  # [kNm]
@@ -319,18 +680,20 @@ class Plate(Element):
 
             mu_lim = 0.374  # [-]
 
-            mu = bend_moment / (width * (eff_height ** 2) * f_cd)  # [-]
-            if mu > mu_lim:
+            mu, alpha_1, required_area = self.get_rectangular_section_area(bend_moment=bend_moment,
+                                                                           width=width,
+                                                                           eff_height=eff_height,
+                                                                           f_cd=f_cd,
+                                                                           f_yd=f_yd,
+                                                                           min_area=min_area,
+                                                                           mu_lim=mu_lim)
+            if required_area is None:
                 remarks.append("Mu value too high!")
                 mu_correct = False
             else:
                 mu_correct = True
                 remarks.append("Mu value correct.")
 
-                alpha_1 = 0.973 - sqrt((0.974 - 1.95 * mu))  # [-]
-
-                required_area = max(alpha_1 * width * eff_height * (f_cd / f_yd), min_area)  # [m^2]
-
                 provided_area, provided_spacing = self.get_plate_reinforcement(required_area=required_area,
                                                                                min_area=min_area,
                                                                                max_area=max_area,
@@ -366,6 +729,9 @@ class Beam(Element):
     ----------
     None
     """
+    __slots__ = ('height', 'width', 'nom_cover', 'bar_diam', 'bend_moment', 'is_support_section', 'fl_height',
+                 'fl_width')
+
     def __init__(self, path):
         """
         Extend Parent's __init__ method. Initialize detailed information about the task (geometry, loads).
@@ -417,21 +783,22 @@ class Beam(Element):
 
         if not self.valid:
             remarks.append("The file is not valid.")
+            remarks.extend(self.validation_remarks)
 
         else:
             remarks.append("The file is valid, starting calculations...")
 
             # Get material properties
-            concrete_properties, steel_properties = self.get_material_properties()
+            concrete_properties, steel_properties = self.concrete_properties, self.steel_properties
 
             # Concrete
-            f_ck = concrete_properties['fck'] * 1000  # [kPa]
-            f_cd = f_ck / 1.4  # [kPa]
-            f_ctm = concrete_properties['fctm'] * 1000  # [kPa]
+            f_ck = self.design_strengths['f_ck']  # [kPa]
+            f_cd = self.design_strengths['f_cd']  # [kPa]
+            f_ctm = self.design_strengths['f_ctm']  # [kPa]
 
             # Steel
-            f_yd = steel_properties['fyd'] * 1000  # [kPa]
-            f_yk = steel_properties['fyk'] * 1000  # [kPa]
+            f_yd = self.design_strengths['f_yd']  # [kPa]
+            f_yk = self.design_strengths['f_yk']  # [kPa]
             bar_diam = self.bar_diam / 1000  # [m]
             stirrup_diam = 0.008  # [m]
 
@@ -443,7 +810,7 @@ class Beam(Element):
 
             # Check nominal cover
             recommended_nom_cover, nom_cover_remarks = self.get_nominal_cover()
-            remarks.append(*nom_cover_remarks)
+            remarks.extend(nom_cover_remarks)
 
             # Load
             bend_moment = self.bend_moment  # [kNm]
@@ -460,9 +827,15 @@ class Beam(Element):
             # check whether beam section is in support or span area
             if support_section:
                 # Calculations for support section
-                mu = bend_moment / (width * (eff_height ** 2) * f_cd)  # [-]
+                mu, alpha_1, required_area = self.get_rectangular_section_area(bend_moment=bend_moment,
+                                                                               width=width,
+                                                                               eff_height=eff_height,
+                                                                               f_cd=f_cd,
+                                                                               f_yd=f_yd,
+                                                                               min_area=min_area,
+                                                                               mu_lim=mu_lim)
 
-                if mu > mu_lim:
+                if required_area is None:
                     remarks.append("Mu value too high!")
                     mu_correct = False
 
@@ -470,16 +843,12 @@ class Beam(Element):
                     remarks.append("Mu value correct.")
                     mu_correct = True
 
-                    alpha_1 = 0.973 - sqrt((0.974 - 1.95 * mu))  # [-]
-
-                    required_area = max(alpha_1 * width * eff_height * (f_cd / f_yd), min_area)  # [m^2]
-
             else:
                 fl_height = self.fl_height / 100  # [m]
                 fl_width = self.fl_width / 100  # [m]
 
                 # Calculations for span section
-                mu = bend_moment / (fl_width * f_cd * (eff_height ** 2))
+                mu = bend_moment / (fl_width * f_cd * (eff_height * eff_height))
 
                 if mu > mu_lim:
                     remarks.append("Mu value too high!")
@@ -488,36 +857,37 @@ class Beam(Element):
                 else:
                     remarks.append("Mu value correct.")
                     mu_correct = True
-                    eta = 1.0
 
-                    lbda_x = ((eta - sqrt((eta ** 2) - 2 * eta * mu)) / eta) * eff_height  # [m]
+                    # Eta coefficient is equal to 1.0 for concrete classes up to C50/60, hence omitted in the formulas
+                    eta = 1.0
+                    alpha_1 = 1 - sqrt(1 - 2 * mu)  # [-]
+                    lbda_x = alpha_1 * eff_height  # [m]
 
                     # Check if the 'T' section is real or apparent
                     if lbda_x < fl_height:  # apparent 'T' section
                         remarks.append("Section is an apparent T section.")
                         section_real = False
 
-                        alpha_1 = eta - sqrt((eta ** 2) - 2 * eta * mu)
-
                         required_area = max(alpha_1 * fl_width * eff_height * (f_cd / f_yd), min_area)  # [m^2]
 
                     else:  # real 'T' section
                         remarks.append("Section is a real T section.")
                         section_real = True
 
-                        bend_moment_1 = fl_height * (fl_width - width) * (
-                                    eff_height - 0.5 * fl_height) * eta * f_cd  # [kNm]
+                        bend_moment_1 = fl_height * (fl_width - width) * (eff_height - 0.5 * fl_height) * f_cd  # [kNm]
                         bend_moment_2 = bend_moment - bend_moment_1  # [kNm]
 
-                        mu_2 = bend_moment_2 / (width * f_cd * eff_height ** 2)
+                        mu_2 = bend_moment_2 / (width * f_cd * (eff_height * eff_height))
                         if mu_2 > mu_lim:
                             remarks.append("Mu value after recalculation too high!")
                             mu2_correct = False
 
                         else:
+                            # Web is designed for the remaining moment, hence alpha coefficient of mu_2
+                            alpha_2 = 1 - sqrt(1 - 2 * mu_2)  # [-]
+
                             required_area_1 = bend_moment_1 / ((eff_height - 0.5 * fl_height) * f_yd)  # [m^2]
-                            required_area_2 = (eta - sqrt((eta ** 2) - 2 * eta * mu)) * width * eff_height * (
-                                        f_cd / f_yd)  # [m^2]
+                            required_area_2 = alpha_2 * width * eff_height * (f_cd / f_yd)  # [m^2]
 
                             required_area = max(required_area_1 + required_area_2, min_area)  # [m^2]
 
@@ -560,6 +930,8 @@ class Column(Element):
     ----------
     None
     """
+    __slots__ = ('height', 'width', 'nom_cover', 'bar_diam', 'bend_moment', 'vert_force')
+
     def __init__(self, path):
         """
         Extend Parent's __init__ method. Initialize detailed information about the task (geometry, loads).
@@ -609,19 +981,20 @@ class Column(Element):
 
         if not self.valid:
             remarks.append("The file is not valid.")
+            remarks.extend(self.validation_remarks)
 
         else:
             remarks.append("The file is valid, starting calculations...")
 
             # Get material properties
-            concrete_properties, steel_properties = self.get_material_properties()
+            concrete_properties, steel_properties = self.concrete_properties, self.steel_properties
 
             # Concrete
-            f_ck = concrete_properties['fck'] * 1000  # [kPa]
-            f_cd = f_ck / 1.4  # [kPa]
+            f_ck = self.design_strengths['f_ck']  # [kPa]
+            f_cd = self.design_strengths['f_cd']  # [kPa]
 
             # Steel
-            f_yd = steel_properties['fyd'] * 1000  # [kPa]
+            f_yd = self.design_strengths['f_yd']  # [kPa]
             bar_diam = self.bar_diam / 1000  # [m]
             stirrup_diam = 0.008  # [m]
 
@@ -632,7 +1005,7 @@ class Column(Element):
 
             # Check nominal cover
             recommended_nom_cover, nom_cover_remarks = self.get_nominal_cover()
-            remarks.append(*nom_cover_remarks)
+            remarks.extend(nom_cover_remarks)
 
             # Load
             bend_moment = self.bend_moment  # [kNm]
@@ -694,21 +1067,15 @@ class Column(Element):
                 elif required_area_2 >= min_area / 2:
                     required_area_1 = min_area - required_area_2
 
-            provided_area_1, provided_bars_1 = self.get_beam_reinforcement(required_area=required_area_1,
-                                                                           min_area=min_area / 2,
-                                                                           max_area=max_area / 2,
-                                                                           bar_diam=bar_diam,
-                                                                           stirrup_diam=stirrup_diam,
-                                                                           width=width,
-                                                                           cover=nom_cover)
-
-            provided_area_2, provided_bars_2 = self.get_beam_reinforcement(required_area=required_area_2,
-                                                                           min_area=min_area / 2,
-                                                                           max_area=max_area / 2,
-                                                                           bar_diam=bar_diam,
-                                                                           stirrup_diam=stirrup_diam,
-                                                                           width=width,
-                                                                           cover=nom_cover)
+            # Both sides of the section share the bars and the width, so they are calculated together
+            layers = self.get_beam_reinforcement_layers(required_areas=(required_area_1, required_area_2),
+                                                        min_area=min_area / 2,
+                                                        max_area=max_area / 2,
+                                                        bar_diam=bar_diam,
+                                                        stirrup_diam=stirrup_diam,
+                                                        width=width,
+                                                        cover=nom_cover)
+            (provided_area_1, provided_bars_1), (provided_area_2, provided_bars_2) = layers
 
         remarks.append("Calculations finished.")
 
@@ -739,6 +1106,9 @@ class Foot(Element):
     ----------
     None
     """
+    __slots__ = ('height', 'width', 'length', 'nom_cover', 'c_height', 'c_width', 'bar_diam', 'col_bar_diam',
+                 'vert_force')
+
     def __init__(self, path):
         """
         Extend Parent's __init__ method. Initialize detailed information about the task (geometry, loads).
@@ -777,22 +1147,16 @@ class Foot(Element):
 
         Returns
         -------
-        float
-        """
-        if dependent_val <= 5:
-            return 0.2
-        elif 5 < dependent_val <= 35:
-            return - 3.4604e-4 * dependent_val ** 2 + 4.0508e-2 * dependent_val + 6.1094e-3
-        elif 35 <= dependent_val <= 50:
-            return 6.9861e-6 * dependent_val ** 3 - 1.0796e-3 * dependent_val ** 2 + 6.6182e-2 * dependent_val - 2.9342e-1
-        elif 50 < dependent_val <= 100:
-            return 2.5424e-8 * dependent_val ** 3 - 3.5481e-5 * dependent_val ** 2 + 1.3977e-2 * dependent_val + 5.7667e-1
-        elif 100 < dependent_val <= 150:
-            return 9.9559e-8 * dependent_val ** 3 - 5.7721e-5 * dependent_val ** 2 + 1.6201e-2 * dependent_val + 5.0253e-1
-        elif 150 < dependent_val <= 300:
-            return 2.3680e-8 * dependent_val ** 3 - 2.3576e-5 * dependent_val ** 2 + 1.1079e-2 * dependent_val + 7.5862e-1
-        elif 300 < dependent_val <= 500:
-            return - 1e-71 * dependent_val ** 3 - 2.2634e-6 * dependent_val ** 2 + 4.6857e-3 * dependent_val + 1.3980
+        float/None
+        """
+        # Find the range containing the dependant value, values above the last limit are not supported
+        range_index = bisect_left(A_COEFFICIENT_LIMITS, dependent_val)
+        if range_index == len(A_COEFFICIENT_LIMITS):
+            return None
+
+        # Evaluate the polynomial of the range using Horner's scheme
+        a_3, a_2, a_1, a_0 = A_COEFFICIENT_POLYNOMIALS[range_index]
+        return ((a_3 * dependent_val + a_2) * dependent_val + a_1) * dependent_val + a_0
 
     def calc_reinforcement(self):
         """
@@ -814,25 +1178,26 @@ class Foot(Element):
         float/None, float/None, float/None
         """
         remarks = []
-        required_area, provided_area, provided_spacing = None, None, None
+        required_area, total_required_area, provided_area, provided_spacing = None, None, None, None
 
         if not self.valid:
             remarks.append("The file is not valid.")
+            remarks.extend(self.validation_remarks)
 
         else:
             remarks.append("The file is valid, starting calculations...")
 
             # Get material properties
-            concrete_properties, steel_properties = self.get_material_properties()
+            concrete_properties, steel_properties = self.concrete_properties, self.steel_properties
 
             # Concrete
-            f_ck = concrete_properties['fck'] * 1000  # [kPa]
-            f_cd = f_ck / 1.4  # [kPa]
-            f_ctk = concrete_properties['fctk_0.05'] * 1000  # [kPa]
-            f_ctd = f_ctk / 1.4  # [kPa]
+            f_ck = self.design_strengths['f_ck']  # [kPa]
+            f_cd = self.design_strengths['f_cd']  # [kPa]
+            f_ctk = self.design_strengths['f_ctk']  # [kPa]
+            f_ctd = self.design_strengths['f_ctd']  # [kPa]
 
             # Steel
-            f_yd = steel_properties['fyd'] * 1000  # [kPa]
+            f_yd = self.design_strengths['f_yd']  # [kPa]
             bar_diam = self.bar_diam / 1000  # [m]
             col_bar_diam = self.col_bar_diam / 1000  # [m]
 
@@ -846,7 +1211,7 @@ class Foot(Element):
 
             # Check nominal cover
             recommended_nom_cover, nom_cover_remarks = self.get_nominal_cover()
-            remarks.append(*nom_cover_remarks)
+            remarks.extend(nom_cover_remarks)
 
             # Load
             vert_force = self.vert_force  # [kN]
@@ -881,7 +1246,7 @@ class Foot(Element):
                 sigma = vert_force / area  # [kPa]
 
                 eff_length = (width - c_width) / 2 + 0.15 * c_width  # [m]
-                bend_moment = sigma * length * ((eff_length ** 2) / 2)  # [kNm]
+                bend_moment = sigma * length * ((eff_length * eff_length) / 2)  # [kNm]
 
                 # Effective height calculation
                 eff_height = height - nom_cover - 1.5 * bar_diam  # [m]
@@ -903,44 +1268,55 @@ class Foot(Element):
                                                                                       bar_diam=bar_diam,
                                                                                       cover=nom_cover)
 
-                provided_area = provided_area_per_rm * length  # [m^2]
+                if provided_spacing is not None:
+                    provided_area = provided_area_per_rm * length  # [m^2]
 
-            if all([provided_area, provided_spacing]):
-                remarks.append("Punching verification.")
-                # Punching verification
-                nu_ed = vert_force / (u0 * eff_height)  # [kPa]
+                if provided_area is not None:
+                    remarks.append("Punching verification.")
+                    # Punching verification
+                    nu_ed = vert_force / (u0 * eff_height)  # [kPa]
 
-                if nu_ed > nu_rd_max:
-                    nu_ed_correct = False
-                    remarks.append("EC requirement not fulfilled, nu_ed value too high.")
+                    if nu_ed > nu_rd_max:
+                        nu_ed_correct = False
+                        remarks.append("EC requirement not fulfilled, nu_ed value too high.")
 
-                else:
-                    nu_ed_correct = True
-                    remarks.append("EC requirement fulfilled, nu_ed value correct.")
+                    else:
+                        nu_ed_correct = True
+                        remarks.append("EC requirement fulfilled, nu_ed value correct.")
 
-                    a_dependant = vert_force / (sigma * c_width * c_height)
-                    a_coeff = round(self.get_a_coefficient(a_dependant), 2)
+                        a_dependant = vert_force / (sigma * c_width * c_height)
+                        a_coeff = self.get_a_coefficient(a_dependant)
 
-                    a = a_coeff * c_width  # [m]
+                        if a_coeff is None:
+                            remarks.append("a coefficient out of range, punching verification not possible.")
 
-                    rho_l = provided_area / (length * eff_height)
-                    k = min(1 + sqrt(200 / (eff_height * 1000)), 2)
-                    nu_min = 0.035 * (k ** (1.5)) * sqrt(f_ck * 1000)  # [kPa]
+                        else:
+                            a_coeff = round(a_coeff, 2)
 
-                    nu_rd = max(0.128 * k * ((100 * rho_l * f_ck) ** (1 / 3)), nu_min) * 2 * eff_height / a  # [kPa]
+                            a = a_coeff * c_width  # [m]
 
-                    u = 2 * c_width + 2 * c_height + 2 * pi * a  # [m]
+                            rho_l = provided_area / (length * eff_height)
+                            k = min(1 + sqrt(200 / (eff_height * 1000)), 2)
 
-                    vert_force_red = vert_force - sigma * (
-                                c_width * c_height + 2 * a * (c_width + c_height) + pi * a ** 2)  # [kN]
-                    nu_ed_red = vert_force_red / (u * eff_height)  # [kPa]
+                            # Empirical shear resistance formulas take f_ck in MPa and give the result in MPa
+                            f_ck_mpa = f_ck / 1000  # [MPa]
+                            nu_min = 0.035 * (k * sqrt(k)) * sqrt(f_ck_mpa) * 1000  # [kPa]
 
-                    if nu_ed_red > nu_rd:
-                        nu_ed_red_correct = False
-                        remarks.append("EC requirement not fulfilled, nu_ed_red value too high.")
-                    else:
-                        nu_ed_red_correct = True
-                        remarks.append("EC requirement fulfilled, nu_ed_red value correct.")
+                            nu_rd = max(0.128 * k * ((100 * rho_l * f_ck_mpa) ** (1 / 3)) * 1000,
+                                        nu_min) * 2 * eff_height / a  # [kPa]
+
+                            u = 2 * c_width + 2 * c_height + 2 * pi * a  # [m]
+
+                            vert_force_red = vert_force - sigma * (
+                                        c_width * c_height + 2 * a * (c_width + c_height) + pi * a * a)  # [kN]
+                            nu_ed_red = vert_force_red / (u * eff_height)  # [kPa]
+
+                            if nu_ed_red > nu_rd:
+                                nu_ed_red_correct = False
+                                remarks.append("EC requirement not fulfilled, nu_ed_red value too high.")
+                            else:
+                                nu_ed_red_correct = True
+                                remarks.append("EC requirement fulfilled, nu_ed_red value correct.")
 
         remarks.append("Calculations finished.")
 
@@ -974,8 +1350,7 @@ dispatcher = {
 
 if __name__ == '__main__':
     path = '../examples/foot_example.rcalc'
-    with open(path) as json_dict:
-        element_parameters = load(json_dict)
+    element_parameters = Element.load_savefile(path)
     ElementClass = dispatcher[element_parameters['element'][:-4]]
     rc_element = ElementClass(element_parameters)
     print(rc_element.valid)
@@ -1,7 +1,18 @@
 from enum import Enum
 
 
-class ExpClass(Enum):
+class PropertyClass(Enum):
+    """Base Enum Class of material property classes
+
+    Members are pickled by their name, so the dictionaries of values are not serialised and unpickling resolves
+    the member directly instead of searching the members by value
+    """
+
+    def __reduce_ex__(self, protocol):
+        return getattr, (self.__class__, self._name_)
+
+
+class ExpClass(PropertyClass):
     """Enum Class containing concrete exposure classes
 
     exposure classes are stored as class attributes referring to dictionaries with related values and remarks
@@ -54,7 +65,7 @@ class ExpClass(Enum):
            "remarks": "Chemical hazard", "S1": None, "S2": None, "S3": None, "S4": None, "S5": None, "S6": None}
 
 
-class ConcreteClass(Enum):
+class ConcreteClass(PropertyClass):
     """ Enum Class containing concrete classes
 
     Concrete classes are stored as class attributes referring to classes' characteristic values
@@ -92,7 +103,7 @@ class ConcreteClass(Enum):
               "fctk_0.95": 5.3, "Ecm": 37, "area_coefficient": 0.0021}
 
 
-class RebarGrade(Enum):
+class RebarGrade(PropertyClass):
     """ Enum Class containing steel classes
 
     Steel classes are stored as class attributes referring to classes' characteristic values
@@ -122,8 +133,8 @@ properties = {
 """dict: Dictionary with material property classes
 """
 
-diameters = [*[n for n in range(6, 24, 2)], 25, 28, 30, 32, 35, 38, 40]
-"""list: List of popular rebar diameters
+diameters = (6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 30, 32, 35, 38, 40)
+"""tuple: Popular rebar diameters [mm], in ascending order
 """
 
 translate = {
@@ -132,7 +143,6 @@ translate = {
     "max_wc": "Maximum water/cement ratio",
     "min_cem": "Minimum cement content [kg/m^3]",
     "remarks": "Remarks about class",
-    "concrete_class": "Concrete class",
     "fck": "Characteristic compressive strength of cylinder sample [MPa]",
     "fck_cube": "Characteristic compressive strength of cube sample [MPa]",
     "fcm": "Mean compressive strength of cylinder sample [MPa]",